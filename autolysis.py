@@ -1,23 +1,14 @@
+import asyncio
+import hashlib
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import openai
-from sklearn.ensemble import IsolationForest
-from sklearn.cluster import KMeans
-from sklearn.impute import SimpleImputer
-
-try:
-    import matplotlib
-    print("Matplotlib is already installed.")
-    matplotlib.use('Agg')
-except ImportError:
-    print("Installing matplotlib...")
-
-AIPROXY_TOKEN = input("Please enter your OpenAI API key: ").strip()
-os.environ["AIPROXY_TOKEN"] = AIPROXY_TOKEN
-openai.api_key = AIPROXY_TOKEN
+
+# Heavy and optional dependencies (matplotlib, scipy, sklearn, openai, polars,
+# httpx) are imported inside the functions that use them to keep import cheap.
 
 def create_project_directory(file_path):
     """Create a directory named after the file (without extension) to store analysis results."""
@@ -29,10 +20,48 @@ def create_project_directory(file_path):
         print(f"Error creating directory '{directory_name}': {e}")
     return directory_name
 
+# pandas' default na_values; Polars only treats empty fields as null unless told otherwise,
+# which would turn any numeric column containing e.g. "NA" into a string column.
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+def _read_csv(file_path):
+    """Read a CSV with the fastest available parser, falling back to pandas' C parser."""
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+    if pl is not None:
+        try:
+            # Polars parses in parallel Rust; convert to plain numpy-backed pandas for sklearn.
+            return pl.read_csv(file_path, encoding="utf8-lossy", infer_schema_length=1000,
+                               null_values=PANDAS_NA_VALUES).to_pandas()
+        except Exception:
+            pass
+    try:
+        # Arrow's multi-threaded reader; numpy dtypes are kept so select_dtypes/sklearn work unchanged.
+        return pd.read_csv(file_path, encoding='ISO-8859-1', engine='pyarrow')
+    except Exception:
+        return pd.read_csv(file_path, encoding='ISO-8859-1')
+
+def _downcast(df):
+    """Shrink numeric columns to the narrowest dtype and low-cardinality strings to categories."""
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes(include="float").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    if len(df):
+        for col in df.select_dtypes(include="object").columns:
+            if df[col].nunique() / len(df) < 0.5:
+                df[col] = df[col].astype("category")
+    return df
+
 def load_csv(file_path):
     """Load CSV file into a DataFrame with error handling for encoding issues."""
     try:
-        df = pd.read_csv(file_path, encoding='ISO-8859-1')
+        df = _downcast(_read_csv(file_path))
         print("CSV file loaded successfully.")
         return df
     except Exception as e:
@@ -42,9 +71,9 @@ def load_csv(file_path):
 def handle_missing_values(df):
     """Handle missing values by imputing with the mean for numeric columns."""
     try:
-        numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        imputer = SimpleImputer(strategy='mean')
-        df[numeric_columns] = imputer.fit_transform(df[numeric_columns])
+        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        block = df[numeric_columns].astype(np.float32)
+        df[numeric_columns] = block.fillna(block.mean(axis=0))
         print("Missing values imputed successfully.")
     except Exception as e:
         print(f"Error handling missing values: {e}")
@@ -58,135 +87,441 @@ def remove_non_numeric_columns(df):
         print(f"Error removing non-numeric columns: {e}")
     return df
 
-def perform_eda(df):
+def _numeric_pipeline(file_path):
+    """Load only the numeric columns, mean-imputed, in one lazy Polars pass.
+
+    Returns None when Polars is unavailable or the scan fails, so the caller can
+    fall back to load_csv/handle_missing_values/remove_non_numeric_columns.
+    """
+    try:
+        import polars as pl
+        import polars.selectors as cs
+    except ImportError:
+        return None
+    try:
+        df = (
+            pl.scan_csv(file_path, encoding="utf8-lossy", infer_schema_length=1000, null_values=PANDAS_NA_VALUES)
+            .select(cs.numeric().cast(pl.Float32))
+            .with_columns(pl.all().fill_null(pl.all().mean()))
+            .collect()
+            .to_pandas()
+        )
+        print("Numeric columns loaded and imputed successfully.")
+        return df
+    except Exception as e:
+        print(f"Error running lazy numeric pipeline, falling back to pandas: {e}")
+        return None
+
+def _extract_numeric(df):
+    """Extract the numeric block once as a float32 array plus its column labels."""
+    numeric_df = df.select_dtypes(include=[np.number])
+    return numeric_df.to_numpy(dtype=np.float32, copy=False), numeric_df.columns
+
+def _column_moments(arr):
+    """Return per-column (count, sum, sum of squares, min, max) of arr, ignoring NaNs."""
+    valid = ~np.isnan(arr)
+    filled = np.where(valid, arr, 0.0).astype(np.float64)
+    lo = np.where(valid, arr, np.inf).min(axis=0, initial=np.inf).astype(np.float64)
+    hi = np.where(valid, arr, -np.inf).max(axis=0, initial=-np.inf).astype(np.float64)
+    return valid.sum(axis=0), filled.sum(axis=0), (filled * filled).sum(axis=0), lo, hi
+
+def _fused_stats(arr):
+    """Compute per-column count/mean/std/min/max/missing and the correlation matrix of arr.
+
+    Vectorised numpy reductions gather the moments; the correlation matrix is then a
+    single float32 GEMM on the mean-centred block, so describe-style statistics,
+    the heatmap and the README all share one set of numbers.
+    """
+    n = arr.shape[0]
+    count, total, sumsq, lo, hi = _column_moments(arr)
+    empty = count == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(empty, np.nan, total / np.maximum(count, 1))
+        var = np.maximum(sumsq / np.maximum(count, 1) - mean * mean, 0.0)
+        std = np.where(count > 1, np.sqrt(var * count / (count - 1)), np.nan)
+    lo[empty] = np.nan
+    hi[empty] = np.nan
+
+    # Missing cells contribute zero once centred, i.e. they are treated as mean-imputed.
+    centred = arr - mean.astype(np.float32)
+    centred[np.isnan(centred)] = 0.0
+    cov = (centred.T @ centred) / max(n, 1)
+    scale = np.sqrt(np.diag(cov))
+    corr = cov / (np.outer(scale, scale) + 1e-12)
+
+    return {
+        "count": count,
+        "mean": mean,
+        "std": std,
+        "min": lo,
+        "max": hi,
+        "missing": n - count,
+        "corr": corr,
+    }
+
+def perform_eda(df, numeric_cols, stats):
     """Perform Exploratory Data Analysis (EDA) on the DataFrame."""
+    # Numeric columns are summarised from the precomputed fused statistics; only
+    # the remaining (non-numeric) columns go through pandas.
+    missing = dict(zip(numeric_cols, stats["missing"].tolist()))
+    missing.update(df.select_dtypes(exclude=[np.number]).isna().sum().to_dict())
+
+    summary_names = ("count", "mean", "std", "min", "max")
+    summary_statistics = {
+        col: {name: stats[name][i].item() for name in summary_names}
+        for i, col in enumerate(numeric_cols)
+    }
+
     eda_results = {
         "shape": df.shape,
         "columns": df.columns.to_list(),
         "data_types": df.dtypes.to_dict(),
-        "missing_values": df.isnull().sum().to_dict(),
-        "summary_statistics": df.describe().to_dict(),
+        "missing_values": {col: missing[col] for col in df.columns},
+        "summary_statistics": summary_statistics,
     }
     return eda_results
 
-def detect_outliers(df):
+def detect_outliers(df, numeric_arr):
     """Detect outliers in the DataFrame using Isolation Forest."""
     try:
-        numeric_columns = df.select_dtypes(include=[np.number])
-        if not numeric_columns.empty:
-            isolation_forest = IsolationForest(contamination=0.05, random_state=42)
-            df['outlier'] = isolation_forest.fit_predict(numeric_columns)
+        if numeric_arr.size:
+            from sklearn.ensemble import IsolationForest
+
+            # Each tree only needs a small subsample (psi=256); build them in parallel.
+            isolation_forest = IsolationForest(
+                n_estimators=100,
+                max_samples=min(256, len(numeric_arr)),
+                contamination=0.05,
+                n_jobs=-1,
+                random_state=42,
+            )
+            df['outlier'] = isolation_forest.fit_predict(numeric_arr)
     except Exception as e:
         print(f"Error detecting outliers: {e}")
 
-def perform_clustering(df):
-    """Perform K-means clustering on the DataFrame."""
+def perform_clustering(df, numeric_arr):
+    """Perform mini-batch K-means clustering on the DataFrame."""
     try:
-        numeric_columns = df.select_dtypes(include=[np.number])
-        if not numeric_columns.empty:
-            kmeans = KMeans(n_clusters=3, random_state=42)
-            df['cluster'] = kmeans.fit_predict(numeric_columns)
+        if numeric_arr.size:
+            from sklearn.cluster import MiniBatchKMeans
+            from sklearn.preprocessing import StandardScaler
+
+            X = np.ascontiguousarray(numeric_arr, dtype=np.float32)
+            # Scale columns so the largest-magnitude feature does not dominate the distances.
+            X = StandardScaler(with_mean=False).fit_transform(X)
+            kmeans = MiniBatchKMeans(n_clusters=3, batch_size=1024, n_init=3, random_state=42)
+            df['cluster'] = kmeans.fit_predict(X)
     except Exception as e:
         print(f"Error performing clustering: {e}")
 
-def create_visualizations(df, output_dir):
-    """Create and save visualizations as PNG files in the project directory."""
+def _hist(ax, x, bins=50, kde_max_rows=5000):
+    """Draw a histogram of x on ax, overlaying a KDE only for small samples."""
+    x = x[np.isfinite(x)]
+    counts, edges = np.histogram(x, bins=bins)
+    ax.stairs(counts, edges, fill=True, alpha=0.6)
+    if 1 < len(x) <= kde_max_rows and np.ptp(x) > 0:
+        xs = np.linspace(edges[0], edges[-1], 200)
+        # Scale the density to match the histogram's count axis.
+        from scipy.stats import gaussian_kde
+        ax.plot(xs, gaussian_kde(x)(xs) * len(x) * (edges[1] - edges[0]))
+
+MAX_SCATTER_POINTS = 50_000
+
+def _scatter_sample(df, max_points=MAX_SCATTER_POINTS):
+    """Return a random row subsample of df when it is too large to plot point by point."""
+    if len(df) <= max_points:
+        return df
+    idx = np.random.default_rng(0).choice(len(df), max_points, replace=False)
+    return df.iloc[np.sort(idx)]
+
+def _new_figure(**kwargs):
+    """Create a Figure bound to an Agg canvas, bypassing pyplot's global figure registry."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+def _annotated_heatmap(corr, labels, path, max_annotated=15):
+    """Render the correlation heatmap to path, annotating cells only for small matrices."""
+    k = len(labels)
+    fig = _new_figure(figsize=(10, 8))
+    ax = fig.subplots()
+    img = ax.imshow(corr, cmap='coolwarm', vmin=-1, vmax=1)
+    fig.colorbar(img, ax=ax)
+    ax.set_xticks(range(k), labels, rotation=90)
+    ax.set_yticks(range(k), labels)
+    # Per-cell annotation text gets unreadable and slow past a handful of columns.
+    if k <= max_annotated:
+        cell_text = np.char.mod("%.2f", corr)
+        for i in range(k):
+            for j in range(k):
+                ax.text(j, i, cell_text[i, j], ha='center', va='center', fontsize=8)
+    ax.set_title("Correlation Heatmap")
+    fig.tight_layout()
+    fig.canvas.print_png(path)
+
+def _plot_hist(x, col, path):
+    """Render the distribution of a single column to path."""
+    fig = _new_figure(figsize=(8, 5))
+    ax = fig.subplots()
+    _hist(ax, x)
+    ax.set_title(f"Distribution of {col}")
+    fig.canvas.print_png(path)
+
+def _plot_pairplot(arr, cols, path):
+    """Render a scatter grid of the given columns to path."""
+    k = len(cols)
+    fig = _new_figure(figsize=(3 * k, 3 * k), dpi=110)
+    axes = fig.subplots(k, k, squeeze=False)
+    for i in range(k):
+        for j in range(k):
+            ax = axes[i, j]
+            if i == j:
+                ax.hist(arr[:, i], bins=40)
+            else:
+                ax.scatter(arr[:, j], arr[:, i], s=4, rasterized=True)
+            if i == k - 1:
+                ax.set_xlabel(cols[j])
+            if j == 0:
+                ax.set_ylabel(cols[i])
+    fig.tight_layout()
+    fig.canvas.print_png(path)
+
+def _outlier_colors(outlier):
+    """Map IsolationForest labels to scatter colour values (1.0 for outliers, 0.0 otherwise)."""
+    return np.where(outlier == -1, 1.0, 0.0).astype(np.float32)
+
+def _cluster_to_float(cluster):
+    """Map cluster labels to float32 scatter colour values."""
+    return cluster.astype(np.float32)
+
+def _plot_outliers(x, y, colors, path):
+    """Render the outlier scatter of a column against the row index to path."""
+    fig = _new_figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sc = ax.scatter(x, y, c=colors, cmap='coolwarm', vmin=0.0, vmax=1.0, s=10)
+    # legend_elements yields one handle per distinct colour value, in ascending order.
+    handles, _ = sc.legend_elements()
+    labels = ["outlier" if value else "inlier" for value in np.unique(colors)]
+    ax.legend(handles, labels)
+    ax.set_title("Outlier Detection")
+    fig.canvas.print_png(path)
+
+def _plot_clusters(x, y, colors, path):
+    """Render the cluster scatter of two columns to path."""
+    fig = _new_figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sc = ax.scatter(x, y, c=colors, cmap='viridis', s=10)
+    ax.legend(*sc.legend_elements(), title="cluster")
+    ax.set_title("Cluster Analysis")
+    fig.canvas.print_png(path)
+
+def create_visualizations(df, numeric_cols, stats, output_dir):
+    """Create and save visualizations as PNG files in the project directory.
+
+    Returns True only if every plot was written successfully.
+    """
     try:
-        # Correlation heatmap
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(df.corr(), annot=True, fmt=".2f", cmap="coolwarm")
-        plt.title("Correlation Heatmap")
-        plt.savefig(os.path.join(output_dir, "correlation_heatmap.png"))
-        plt.close()
+        import matplotlib
+        # Select the backend once, before any worker thread starts drawing.
+        matplotlib.use("Agg", force=True)
+
+        numeric_columns = numeric_cols.tolist()
+        # Everything the workers read is computed up front so no two threads touch df.
+        corr = stats["corr"]
+        plot_df = _scatter_sample(df)
+        tasks = [(_annotated_heatmap, corr, numeric_columns, os.path.join(output_dir, "correlation_heatmap.png"))]
 
         # Distribution plot for numeric columns
-        numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
         for col in numeric_columns[:3]:  # Limit to first 3 for simplicity
-            plt.figure(figsize=(8, 5))
-            sns.histplot(df[col], kde=True)
-            plt.title(f"Distribution of {col}")
-            plt.savefig(os.path.join(output_dir, f"distribution_{col}.png"))
-            plt.close()
+            tasks.append((_plot_hist, df[col].to_numpy(), col,
+                          os.path.join(output_dir, f"distribution_{col}.png")))
 
         # Pairplot for first 3 numeric columns
         if len(numeric_columns) >= 2:
-            sns.pairplot(df[numeric_columns[:3]])
-            plt.savefig(os.path.join(output_dir, "pairplot.png"))
+            pair_cols = numeric_columns[:3]
+            tasks.append((_plot_pairplot, df[pair_cols].to_numpy(dtype=np.float32), pair_cols,
+                          os.path.join(output_dir, "pairplot.png")))
 
         if 'outlier' in df.columns:
-            plt.figure(figsize=(8, 5))
-            sns.scatterplot(x=df.index, y=df[numeric_columns[0]], hue=df['outlier'], palette='coolwarm')
-            plt.title("Outlier Detection")
-            plt.savefig(os.path.join(output_dir, "outliers.png"))
-            plt.close()
+            tasks.append((_plot_outliers, plot_df.index.to_numpy(), plot_df[numeric_columns[0]].to_numpy(),
+                          _outlier_colors(plot_df['outlier'].to_numpy()),
+                          os.path.join(output_dir, "outliers.png")))
 
         if 'cluster' in df.columns and len(numeric_columns) >= 2:
-            plt.figure(figsize=(8, 5))
-            sns.scatterplot(x=df[numeric_columns[0]], y=df[numeric_columns[1]], hue=df['cluster'], palette='viridis')
-            plt.title("Cluster Analysis")
-            plt.savefig(os.path.join(output_dir, "clusters.png"))
-            plt.close()
+            tasks.append((_plot_clusters, plot_df[numeric_columns[0]].to_numpy(),
+                          plot_df[numeric_columns[1]].to_numpy(),
+                          _cluster_to_float(plot_df['cluster'].to_numpy()),
+                          os.path.join(output_dir, "clusters.png")))
+
+        executor = ThreadPoolExecutor(max_workers=4)
+        futures = [executor.submit(func, *args) for func, *args in tasks]
+        executor.shutdown(wait=True)
+        for future in futures:
+            future.result()
+        return True
     except Exception as e:
         print(f"Error creating visualizations: {e}")
+        return False
 
 def generate_readme(eda_results, output_dir):
     """Generate a README.md file in the project directory."""
     try:
         readme_path = os.path.join(output_dir, "README.md")
+        parts = [
+            "# Data Analysis Report\n\n",
+            "## Data Overview\n\n",
+            f"**Number of rows**: {eda_results['shape'][0]}\n\n",
+            f"**Number of columns**: {eda_results['shape'][1]}\n\n",
+            "### Column Details\n",
+        ]
+        parts.extend(f"- **{col}**: {dtype}\n" for col, dtype in eda_results['data_types'].items())
+
+        parts.append("\n## Summary Statistics\n\n")
+        for col, stats in eda_results['summary_statistics'].items():
+            parts.append(f"### {col}\n")
+            parts.extend(f"- {name}: {value}\n" for name, value in stats.items())
+
+        parts.append("\n## Visualizations\n\n")
+        parts.append("![](correlation_heatmap.png)\n\n")
+        parts.extend(f"![](distribution_{col}.png)\n\n" for col in eda_results['columns'][:3])
+        parts.append("![](pairplot.png)\n\n")
+        parts.append("![](outliers.png)\n\n")
+        parts.append("![](clusters.png)\n\n")
+
+        # Assemble in memory and hand the whole report to a single write().
         with open(readme_path, "w") as file:
-            file.write("# Data Analysis Report\n\n")
-            file.write("## Data Overview\n\n")
-            file.write(f"**Number of rows**: {eda_results['shape'][0]}\n\n")
-            file.write(f"**Number of columns**: {eda_results['shape'][1]}\n\n")
-            file.write("### Column Details\n")
-            for col, dtype in eda_results['data_types'].items():
-                file.write(f"- **{col}**: {dtype}\n")
-            
-            file.write("\n## Visualizations\n\n")
-            file.write("![](correlation_heatmap.png)\n\n")
-            for col in eda_results['columns'][:3]:
-                file.write(f"![](distribution_{col}.png)\n\n")
-            file.write("![](pairplot.png)\n\n")
-            file.write("![](outliers.png)\n\n")
-            file.write("![](clusters.png)\n\n")
+            file.write("".join(parts))
     except Exception as e:
         print(f"Error generating README.md: {e}")
 
-def generate_openai_summary(file_path):
-    """Use OpenAI API to generate a summary of the analysis process."""
+MAX_SUMMARY_CHARS = 12000
+
+def _read_head(file_path, max_chars=MAX_SUMMARY_CHARS):
+    """Read at most max_chars characters from the start of file_path."""
+    with open(file_path, "r") as file:
+        return file.read(max_chars)
+
+async def generate_openai_summary_async(file_path):
+    """Use OpenAI API to generate a summary of the analysis process without blocking the pipeline."""
     try:
-        with open(file_path, "r") as file:
-            content = file.read()
+        import httpx
 
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
+        # Roughly the first ~3000 tokens is plenty for a 150-token summary.
+        content = await asyncio.to_thread(_read_head, file_path)
+        payload = {
+            "model": "gpt-3.5-turbo",
+            "messages": [
                 {"role": "system", "content": "You are an assistant that summarizes Python scripts."},
                 {"role": "user", "content": f"Provide a summary of the following script:\n\n{content}"}
             ],
-            max_tokens=150
-        )
-        
-        summary = response.choices[0].message['content'].strip()
+            "max_tokens": 150,
+        }
+        headers = {"Authorization": f"Bearer {os.environ.get('AIPROXY_TOKEN', '')}"}
+        async with httpx.AsyncClient(timeout=60) as client:
+            response = await client.post("https://api.openai.com/v1/chat/completions", json=payload, headers=headers)
+            response.raise_for_status()
+
+        summary = response.json()["choices"][0]["message"]["content"].strip()
         print("OpenAI Summary:\n", summary)
     except Exception as e:
         print(f"Error generating summary with OpenAI API: {e}")
 
+async def _visualize_and_summarize(df, numeric_cols, stats, output_dir, file_path):
+    """Overlap the OpenAI request with plot rendering; returns create_visualizations' result."""
+    _, visualized = await asyncio.gather(
+        generate_openai_summary_async(file_path),
+        asyncio.to_thread(create_visualizations, df, numeric_cols, stats, output_dir),
+    )
+    return visualized
+
+def _content_hash(path):
+    """Return a BLAKE2b digest of the file's contents, streamed in 1 MB chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _cache_marker(output_dir, digest):
+    """Path of the sentinel recording a completed analysis of the given content hash."""
+    return os.path.join(output_dir, f".hash-{digest}")
+
+def _has_cached_results(output_dir, digest):
+    """Check whether output_dir already holds a complete analysis of this content."""
+    paths = [_cache_marker(output_dir, digest)]
+    paths += [os.path.join(output_dir, name) for name in ("README.md", "correlation_heatmap.png")]
+    return all(os.path.exists(path) for path in paths)
+
+def _mark_cached(output_dir, digest):
+    """Record a completed analysis, replacing markers left by earlier versions of the file."""
+    for name in os.listdir(output_dir):
+        if name.startswith(".hash-"):
+            os.remove(os.path.join(output_dir, name))
+    with open(_cache_marker(output_dir, digest), "w"):
+        pass
 
 def main(file_path):
     """Main function to run the analysis pipeline."""
     output_dir = create_project_directory(file_path)
-    df = load_csv(file_path)
+    try:
+        digest = _content_hash(file_path)
+    except OSError as e:
+        print(f"Error hashing '{file_path}', caching disabled: {e}")
+        digest = None
+    if digest is not None and _has_cached_results(output_dir, digest):
+        print(f"'{file_path}' is unchanged since the last run; reusing results in '{output_dir}'.")
+        # The summary is only printed, never stored, so it is regenerated on cache hits.
+        asyncio.run(generate_openai_summary_async(file_path))
+        return
+
+    df = _numeric_pipeline(file_path)
+    if df is None:
+        df = load_csv(file_path)
+        if df is not None:
+            handle_missing_values(df)
+            df = remove_non_numeric_columns(df)
     if df is not None:
-        handle_missing_values(df)
-        df = remove_non_numeric_columns(df)
-        eda_results = perform_eda(df)
-        detect_outliers(df)
-        perform_clustering(df)
-        create_visualizations(df, output_dir)
+        numeric_arr, numeric_cols = _extract_numeric(df)
+        stats = _fused_stats(numeric_arr)
+        eda_results = perform_eda(df, numeric_cols, stats)
+        detect_outliers(df, numeric_arr)
+        perform_clustering(df, numeric_arr)
         generate_readme(eda_results, output_dir)
-        generate_openai_summary(file_path)
+        visualized = asyncio.run(_visualize_and_summarize(df, numeric_cols, stats, output_dir, file_path))
+        if digest is not None and visualized:
+            _mark_cached(output_dir, digest)
+
+def _unique_datasets(file_paths):
+    """Drop repeated paths; return None if distinct CSVs would share an output directory."""
+    by_realpath = {}
+    for path in file_paths:
+        by_realpath.setdefault(os.path.realpath(path), path)
+    by_output_dir = {}
+    for path in by_realpath.values():
+        output_dir = os.path.splitext(os.path.basename(path))[0]
+        if output_dir in by_output_dir:
+            print(f"Error: '{by_output_dir[output_dir]}' and '{path}' would both write to '{output_dir}'; "
+                  "rename one or run them separately.")
+            return None
+        by_output_dir[output_dir] = path
+    return list(by_realpath.values())
 
 if __name__ == "__main__":
-    file_path = input('Enter the file path to your CSV: ').strip('"').strip("'")
-    main(file_path)
\ No newline at end of file
+    os.environ["AIPROXY_TOKEN"] = input("Please enter your OpenAI API key: ").strip()
+    file_paths = sys.argv[1:] or [input('Enter the file path to your CSV: ')]
+    file_paths = _unique_datasets([path.strip('"').strip("'") for path in file_paths])
+    if file_paths is None:
+        sys.exit(1)
+    if len(file_paths) == 1:
+        main(file_paths[0])
+    else:
+        # Datasets are independent; spawn gives each worker a clean matplotlib/sklearn state.
+        # ProcessPoolExecutor workers are not daemonic, so IsolationForest(n_jobs=-1) can
+        # still use loky inside them (multiprocessing.Pool would force n_jobs=1).
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            list(executor.map(main, file_paths))